@@ -1,6 +1,9 @@
+import struct
 import time
+from contextlib import contextmanager
 from enum import IntEnum
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 
 from loguru import logger
 from pymodbus.client.serial import ModbusSerialClient
@@ -16,6 +19,81 @@ class ModbusFunction(IntEnum):
     WRITE_MULTIPLE_REGISTERS = 0x10
 
 
+def _generate_crc16_table() -> Tuple[int, ...]:
+    """Generate the lookup table for the Modbus CRC16 (polynomial 0xA001)"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _generate_crc16_table()
+
+
+def _crc16(data: bytes) -> int:
+    """Compute the Modbus RTU CRC16 of a frame"""
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ byte) & 0xFF]
+    return crc
+
+
+@lru_cache(maxsize=256)
+def _build_write_registers_frame(
+    device_id: int, register_address: int, values: Tuple[int, ...]
+) -> bytes:
+    """Build a complete Modbus RTU write multiple registers (0x10) frame
+
+    Frames are cached, so repeated writes of the same values skip both the
+    PDU construction and the CRC computation.
+
+    Args:
+        device_id: Modbus device ID
+        register_address: First register address to write
+        values: Register values to write
+
+    Returns:
+        Raw RTU frame including the trailing CRC
+    """
+    frame = struct.pack(
+        f">BBHHB{len(values)}H",
+        device_id,
+        ModbusFunction.WRITE_MULTIPLE_REGISTERS,
+        register_address,
+        len(values),
+        len(values) * 2,
+        *values,
+    )
+    return frame + struct.pack("<H", _crc16(frame))
+
+
+@lru_cache(maxsize=256)
+def _build_write_register_frame(
+    device_id: int, register_address: int, value: int
+) -> bytes:
+    """Build a complete Modbus RTU write single register (0x06) frame
+
+    Args:
+        device_id: Modbus device ID
+        register_address: Register address to write
+        value: Register value to write
+
+    Returns:
+        Raw RTU frame including the trailing CRC
+    """
+    frame = struct.pack(
+        ">BBHH",
+        device_id,
+        ModbusFunction.WRITE_SINGLE_REGISTER,
+        register_address,
+        value,
+    )
+    return frame + struct.pack("<H", _crc16(frame))
+
+
 class DH5Registers:
     """DH5 robot register addresses"""
 
@@ -68,10 +146,60 @@ class DH5Registers:
     INIT_MODE_OPEN = 0b10
     INIT_MODE_FIND_STROKE = 0b11
 
-    # Intialization status
+    # Intialization status (2 bits per axis, as reported by RETURN_TO_ZERO_STATUS)
     INIT_STATUS_NOT_INITIALIZED = 0b00
-    INIT_STATUS_INITIALIZING = 0b01
-    INIT_STATUS_INITIALIZED = 0b10
+    INIT_STATUS_INITIALIZED = 0b01
+    INIT_STATUS_INITIALIZING = 0b10
+
+    # Status register value once every axis reports initialized, i.e.
+    # INIT_STATUS_INITIALIZED repeated in each of the 6 axis fields
+    INIT_STATUS_ALL_INITIALIZED = INIT_STATUS_INITIALIZED * 0b010101010101
+
+
+def _compile_clamp_positions(axis_count: int) -> Callable[..., List[int]]:
+    """Generate a position clamp function unrolled for a fixed number of axes
+
+    The generated function takes (positions, upper_limits, margin) and
+    returns max(margin, min(position, upper_limit)) for every axis as
+    straight-line code, avoiding the per-axis loop on the hot
+    set_all_positions path.
+    """
+    lanes = range(axis_count)
+    lines = [f"def _clamp_positions_{axis_count}(p, h, margin):"]
+    lines.append(f"    {', '.join(f'p{i}' for i in lanes)}, = p")
+    lines.append(f"    {', '.join(f'h{i}' for i in lanes)}, = h")
+    for i in lanes:
+        lines.append(f"    c{i} = p{i} if p{i} < h{i} else h{i}")
+        lines.append(f"    c{i} = c{i} if c{i} > margin else margin")
+    lines.append(f"    return [{', '.join(f'c{i}' for i in lanes)}]")
+
+    namespace: dict = {}
+    exec("\n".join(lines), namespace)
+    return namespace[f"_clamp_positions_{axis_count}"]
+
+
+_clamp_axis_positions = _compile_clamp_positions(DH5Registers.AXIS_COUNT)
+
+_AXIS_KEYS = tuple(f"axis_F{axis + 1}" for axis in range(DH5Registers.AXIS_COUNT))
+
+_INIT_STATUS_NAMES = {
+    DH5Registers.INIT_STATUS_INITIALIZED: "initialized",
+    DH5Registers.INIT_STATUS_INITIALIZING: "initializing",
+}
+
+
+def _generate_init_status_table() -> Tuple[Tuple[str, ...], ...]:
+    """Decode every possible 12-bit initialization status register value"""
+    return tuple(
+        tuple(
+            _INIT_STATUS_NAMES.get((value >> (axis * 2)) & 0b11, "not initialized")
+            for axis in range(DH5Registers.AXIS_COUNT)
+        )
+        for value in range(1 << (2 * DH5Registers.AXIS_COUNT))
+    )
+
+
+_INIT_STATUS_TABLE = _generate_init_status_table()
 
 
 class DH5ModbusAPI:
@@ -87,7 +215,8 @@ class DH5ModbusAPI:
     ERROR_CRC_CHECK_FAILED = 3
     ERROR_INVALID_COMMAND = 4
 
-    max_positions = [500] * DH5Registers.AXIS_COUNT
+    # Keep position targets at least this many units away from the limits
+    POSITION_MARGIN = 10
 
     def __init__(
         self,
@@ -115,6 +244,29 @@ class DH5ModbusAPI:
         self.parity = parity
         self.timeout = timeout
         self.client: Optional[ModbusSerialClient] = None
+        self._batch: Optional[
+            List[Tuple[int, int, Optional[Union[int, List[int]]]]]
+        ] = None
+        self._batch_results: List[int] = []
+        self._t35 = 0.0
+        self._next_frame_time = 0.0
+        self.max_positions = [500] * DH5Registers.AXIS_COUNT
+
+    @property
+    def max_positions(self) -> Tuple[int, ...]:
+        """Maximum position of each axis, used to clamp position targets
+
+        Read-only tuple; assign a new sequence to change the limits.
+        """
+        return self._max_positions
+
+    @max_positions.setter
+    def max_positions(self, max_positions: List[int]):
+        self._max_positions = tuple(max_positions)
+        # Upper clamp limit of each axis, cached for the position write path
+        self._position_limits = tuple(
+            max_pos - self.POSITION_MARGIN for max_pos in self._max_positions
+        )
 
     def open_connection(self) -> int:
         """Open Modbus RTU connection
@@ -122,6 +274,11 @@ class DH5ModbusAPI:
         Returns:
             SUCCESS if connection opened successfully, error code otherwise
         """
+        # Modbus RTU 3.5 character interframe silence, 11 bits per character,
+        # fixed at 1.75 ms above 19200 baud by the specification
+        self._t35 = max(1.75e-3, 3.5 * 11.0 / self.baud_rate)
+        self._next_frame_time = 0.0
+
         try:
             self.client = ModbusSerialClient(
                 port=self.port,
@@ -187,6 +344,16 @@ class DH5ModbusAPI:
             Register values for read operations, SUCCESS for write operations,
             or error code on failure
         """
+        if self._batch is not None and function_code in [
+            ModbusFunction.WRITE_SINGLE_REGISTER,
+            ModbusFunction.WRITE_MULTIPLE_REGISTERS,
+        ]:
+            # Copy list data so later changes by the caller are not sent
+            if isinstance(data, list):
+                data = list(data)
+            self._batch.append((function_code, register_address, data))
+            return self.SUCCESS
+
         if not self._validate_connection():
             return self.ERROR_CONNECTION_FAILED
 
@@ -204,6 +371,144 @@ class DH5ModbusAPI:
             logger.error(f"Unexpected error: {str(e)}")
             return self.ERROR_INVALID_RESPONSE
 
+    @contextmanager
+    def batch(self) -> Iterator[List[int]]:
+        """Queue write commands and send them as one back-to-back burst
+
+        Write commands issued inside the block return SUCCESS immediately and
+        are queued. On exit the connection is validated once, every queued
+        command is built into a raw RTU frame, and the frames are written in
+        order separated only by the Modbus RTU 3.5 character interframe gap
+        computed when the connection was opened. Read commands are not
+        queued and are sent immediately. Nested blocks join the outermost
+        batch and yield its results list.
+
+        Yields:
+            List that is filled with one result code per queued command
+            once the outermost block exits
+        """
+        if self._batch is not None:
+            yield self._batch_results
+            return
+
+        results: List[int] = []
+        self._batch = []
+        self._batch_results = results
+        try:
+            yield results
+        finally:
+            commands, self._batch = self._batch, None
+
+        if not commands:
+            return
+        if not self._validate_connection():
+            results.extend([self.ERROR_CONNECTION_FAILED] * len(commands))
+            return
+
+        # Build every frame before the first one goes out
+        frames: List[Optional[bytes]] = []
+        for function_code, register_address, data in commands:
+            try:
+                frames.append(
+                    self._build_write_frame(function_code, register_address, data)
+                )
+            except (ValueError, struct.error) as e:
+                logger.error(f"Invalid batched command: {str(e)}")
+                frames.append(None)
+
+        self._clear_recv_buffer()
+        for frame in frames:
+            if frame is None:
+                results.append(self.ERROR_INVALID_RESPONSE)
+                continue
+            self._wait_interframe()
+            try:
+                self._send_raw_frame(frame)
+                results.append(self.SUCCESS)
+            except (ModbusException, ConnectionError) as e:
+                logger.error(f"Modbus operation failed: {str(e)}")
+                results.append(self.ERROR_INVALID_RESPONSE)
+        logger.debug(f"Batch of {len(commands)} commands sent: {results}")
+
+    def _build_write_frame(
+        self,
+        function_code: int,
+        register_address: int,
+        data: Optional[Union[int, List[int]]],
+    ) -> bytes:
+        """Build the raw RTU frame for a write command
+
+        Args:
+            function_code: WRITE_SINGLE_REGISTER or WRITE_MULTIPLE_REGISTERS
+            register_address: Register address to write
+            data: Value (single) or values (multiple) to write
+
+        Returns:
+            Raw RTU frame including the trailing CRC
+
+        Raises:
+            ValueError: For invalid function codes or data
+        """
+        if function_code == ModbusFunction.WRITE_SINGLE_REGISTER:
+            if data is None:
+                raise ValueError("Data is required for write single register")
+            if isinstance(data, list):
+                raise ValueError("Single register write requires int, not list")
+            if not isinstance(data, int):
+                raise ValueError("Register values must be integers")
+            return _build_write_register_frame(self.modbus_id, register_address, data)
+        elif function_code == ModbusFunction.WRITE_MULTIPLE_REGISTERS:
+            if data is None:
+                raise ValueError("Data is required for write multiple registers")
+            if isinstance(data, int):
+                data = [data]  # Convert single int to list
+
+            # Checked before the cache lookup, where 100.0 would match 100
+            values = tuple(data)
+            if not all(isinstance(value, int) for value in values):
+                raise ValueError("Register values must be integers")
+            return _build_write_registers_frame(
+                self.modbus_id, register_address, values
+            )
+        else:
+            raise ValueError(f"Unsupported write function code: {function_code}")
+
+    def _send_raw_frame(self, frame: bytes):
+        """Write a raw RTU frame that expects no response
+
+        Raises:
+            ConnectionError: If the frame was not written completely
+        """
+        if self.client.send(frame) != len(frame):
+            raise ConnectionError("Failed to write complete Modbus frame")
+        # The frame is still being shifted out when send() returns
+        self._mark_frame_sent(len(frame))
+
+    def _wait_interframe(self):
+        """Wait until the interframe silence after the last frame has passed
+
+        time.sleep() is only used for the bulk of the wait since its
+        granularity is around 1 ms; the last 500 us are busy-waited.
+        """
+        remaining = self._next_frame_time - time.perf_counter()
+        if remaining <= 0:
+            return
+        if remaining > 5e-4:
+            time.sleep(remaining - 5e-4)
+        while time.perf_counter() < self._next_frame_time:
+            pass
+
+    def _mark_frame_sent(self, frame_length: int = 0):
+        """Record when the next frame may be sent
+
+        Args:
+            frame_length: Bytes still being shifted out after the call
+                returned, 0 once a response has been fully received
+        """
+        self._next_frame_time = (
+            time.perf_counter() + frame_length * 11.0 / self.baud_rate + self._t35
+        )
+
     def _clear_recv_buffer(self):
         """Clear the receive buffer of the Modbus client"""
         if self.client:
@@ -215,7 +520,7 @@ class DH5ModbusAPI:
         register_address: int,
         data: Optional[Union[int, List[int]]],
         data_length: Optional[int],
-    ) -> ModbusPDU:
+    ) -> Optional[ModbusPDU]:
         """Execute specific Modbus function
 
         Args:
@@ -225,7 +530,7 @@ class DH5ModbusAPI:
             data_length: Length for read operations
 
         Returns:
-            Modbus response object
+            Modbus response object, or None for raw frame writes
 
         Raises:
             ValueError: For invalid function codes or missing data
@@ -233,11 +538,16 @@ class DH5ModbusAPI:
         if not self.client:
             raise ConnectionError("Modbus client not initialized")
 
+        self._wait_interframe()
+
         if function_code == ModbusFunction.READ_HOLDING_REGISTERS:
             self._clear_recv_buffer()
-            return self.client.read_holding_registers(
-                register_address, count=data_length or 1, device_id=self.modbus_id
-            )
+            try:
+                return self.client.read_holding_registers(
+                    register_address, count=data_length or 1, device_id=self.modbus_id
+                )
+            finally:
+                self._mark_frame_sent()
         elif function_code == ModbusFunction.WRITE_SINGLE_REGISTER:
             if data is None:
                 raise ValueError("Data is required for write single register")
@@ -246,31 +556,27 @@ class DH5ModbusAPI:
 
             self._clear_recv_buffer()
 
-            return self.client.write_register(
-                register_address,
-                data,
-                device_id=self.modbus_id,
-                no_response_expected=True,
-            )
+            try:
+                return self.client.write_register(
+                    register_address,
+                    data,
+                    device_id=self.modbus_id,
+                    no_response_expected=True,
+                )
+            finally:
+                # Device ID, function code, address, value and CRC
+                self._mark_frame_sent(8)
         elif function_code == ModbusFunction.WRITE_MULTIPLE_REGISTERS:
-            if data is None:
-                raise ValueError("Data is required for write multiple registers")
-            if isinstance(data, int):
-                data = [data]  # Convert single int to list
-
+            # No response is expected, so write the cached raw frame directly
+            frame = self._build_write_frame(function_code, register_address, data)
             self._clear_recv_buffer()
-
-            return self.client.write_registers(
-                register_address,
-                data,
-                device_id=self.modbus_id,
-                no_response_expected=True,
-            )
+            self._send_raw_frame(frame)
+            return None
         else:
             raise ValueError(f"Unsupported function code: {function_code}")
 
     def _parse_response(
-        self, response: ModbusPDU, function_code: int
+        self, response: Optional[ModbusPDU], function_code: int
     ) -> Union[int, List[int]]:
         """Parse Modbus response
 
@@ -331,20 +637,29 @@ class DH5ModbusAPI:
             return self.ERROR_INVALID_RESPONSE
 
     def _validate_and_clamp_positions(self, positions):
-        if not self.max_positions:
+        if not self._max_positions:
             logger.warning(
                 "Warning: Maximum positions not initialized, using positions as-is"
             )
             return positions
 
-        if len(positions) != len(self.max_positions):
+        if len(positions) != len(self._max_positions):
             raise ValueError(
-                f"Position list length {len(positions)} does not match number of axes {len(self.max_positions)}"
+                f"Position list length {len(positions)} does not match number of axes {len(self._max_positions)}"
             )
 
+        margin = self.POSITION_MARGIN
+        if len(positions) == DH5Registers.AXIS_COUNT:
+            clamped_positions = _clamp_axis_positions(
+                positions, self._position_limits, margin
+            )
+            logger.debug(
+                f"Clamped positions: {clamped_positions} (original: {positions})"
+            )
+            return clamped_positions
+
         clamped_positions = []
-        margin = 10
-        for i, (pos, max_pos) in enumerate(zip(positions, self.max_positions)):
+        for i, (pos, max_pos) in enumerate(zip(positions, self._max_positions)):
             # Ensure position is within (0, max_pos) range
             clamped_pos = max(
                 margin, min(pos, max_pos - margin)
@@ -398,19 +713,43 @@ class DH5ModbusAPI:
         )
 
         if isinstance(result, list) and len(result) > 0:
-            init_status = result[0]
-            status = {}
-            for axis in range(6):
-                axis_status = (init_status >> (axis * 2)) & 0b11
-                if axis_status == 0b01:
-                    status[f"axis_F{axis + 1}"] = "initialized"
-                elif axis_status == 0b10:
-                    status[f"axis_F{axis + 1}"] = "initializing"
-                else:
-                    status[f"axis_F{axis + 1}"] = "not initialized"
-            return status
+            return self.decode_initialization(result[0])
         return result if isinstance(result, int) else self.ERROR_INVALID_RESPONSE
 
+    def check_initialization_mask(self) -> Optional[int]:
+        """Read the raw initialization status register of all 6 axes
+
+        Cheaper than check_initialization() for polling loops: compare the
+        value against DH5Registers.INIT_STATUS_ALL_INITIALIZED and only call
+        decode_initialization() when the details are needed.
+
+        Returns:
+            12-bit register value (2 bits per axis, axis F1 in the lowest
+            bits), or None on failure
+        """
+        result = self.send_modbus_command(
+            function_code=ModbusFunction.READ_HOLDING_REGISTERS,
+            register_address=DH5Registers.RETURN_TO_ZERO_STATUS,
+            data_length=1,
+        )
+
+        if isinstance(result, list) and len(result) > 0:
+            return result[0] & 0xFFF
+        return None
+
+    @staticmethod
+    def decode_initialization(register: int) -> dict:
+        """Decode a raw initialization status register value
+
+        Args:
+            register: Value of the RETURN_TO_ZERO_STATUS register
+
+        Returns:
+            Dictionary with axis status
+            Status values: "not initialized", "initialized", "initializing"
+        """
+        return dict(zip(_AXIS_KEYS, _INIT_STATUS_TABLE[register & 0xFFF]))
+
     # Individual Axis Status Methods
     def get_axis_position(self, axis: int) -> Union[List[int], int]:
         """Get current position of specific axis
@@ -566,22 +905,12 @@ class DH5ModbusAPI:
 
         # Scale positions by ratio
         scaled_positions = [
-            int(max_pos * ratio) for max_pos, ratio in zip(self.max_positions, scalings)
+            int(max_pos * ratio)
+            for max_pos, ratio in zip(self._max_positions, scalings)
         ]
         logger.debug(f"Scaled positions: {scaled_positions} from ratios: {scalings}")
 
-        safe_positions = self._validate_and_clamp_positions(scaled_positions)
-        logger.debug(
-            f"Safe positions after clamping: {safe_positions} (original: {scaled_positions})"
-        )
-
-        result = self.send_modbus_command(
-            function_code=ModbusFunction.WRITE_MULTIPLE_REGISTERS,
-            register_address=DH5Registers.AXIS_POSITION_BASE,
-            data=safe_positions,
-            data_length=DH5Registers.AXIS_COUNT,
-        )
-        return result if isinstance(result, int) else self.ERROR_INVALID_RESPONSE
+        return self.set_all_positions(scaled_positions)
 
     def set_all_forces(self, forces: list[float]) -> int:
         if len(forces) != DH5Registers.AXIS_COUNT:
@@ -5,10 +5,25 @@ This example demonstrates basic connection, initialization,
 and position control.
 """
 
-from dh5_api import DH5ModbusAPI
+from dh5_api import DH5ModbusAPI, DH5Registers
 import time
 
 
+def poll_delay(attempt, initial=0.02, maximum=0.2):
+    """
+    Exponential backoff delay between status polls
+
+    Args:
+        attempt: Number of polls already made
+        initial: Delay before the second poll in seconds
+        maximum: Upper bound for the delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    return min(maximum, initial * 1.5**attempt)
+
+
 def main():
     """Basic usage example"""
 
@@ -41,15 +56,18 @@ def main():
         print(f"Initialization status: {status}")
 
         # Wait until all axes are initialized
+        last_register = None
+        attempt = 0
         while True:
-            status = robot.check_initialization()
-            if isinstance(status, dict) and all(
-                s == "initialized" for s in status.values()
-            ):
+            register = robot.check_initialization_mask()
+            if register == DH5Registers.INIT_STATUS_ALL_INITIALIZED:
                 print("All axes initialized!")
                 break
-            print("Waiting for initialization...")
-            time.sleep(1)
+            if register != last_register:
+                print("Waiting for initialization...")
+                last_register = register
+            time.sleep(poll_delay(attempt))
+            attempt += 1
 
         # Get current positions
         positions = robot.get_all_positions()
@@ -5,9 +5,26 @@ This example demonstrates different initialization modes
 and monitoring initialization progress.
 """
 
-from dh5_api import DH5ModbusAPI
+from dh5_api import DH5ModbusAPI, DH5Registers
 import time
 
+AXIS_KEYS = tuple(f"axis_F{i}" for i in range(1, DH5Registers.AXIS_COUNT + 1))
+
+
+def poll_delay(attempt, initial=0.02, maximum=0.2):
+    """
+    Exponential backoff delay between status polls
+
+    Args:
+        attempt: Number of polls already made
+        initial: Delay before the second poll in seconds
+        maximum: Upper bound for the delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    return min(maximum, initial * 1.5**attempt)
+
 
 def wait_for_initialization(robot, timeout=30):
     """
@@ -21,22 +38,33 @@ def wait_for_initialization(robot, timeout=30):
         True if successful, False if timeout
     """
     start_time = time.time()
+    last_register = None
+    attempt = 0
 
     while time.time() - start_time < timeout:
-        status = robot.check_initialization()
+        register = robot.check_initialization_mask()
 
-        if isinstance(status, dict):
-            print(f"Status: {status}")
-
-            if all(s == "initialized" for s in status.values()):
+        if register is not None:
+            if register == DH5Registers.INIT_STATUS_ALL_INITIALIZED:
+                print(f"Status: {robot.decode_initialization(register)}")
                 return True
 
-            # Show which axes are still initializing
-            initializing = [k for k, v in status.items() if v == "initializing"]
-            if initializing:
-                print(f"  Still initializing: {initializing}")
+            # Only decode and report when something changed
+            if register != last_register:
+                status = robot.decode_initialization(register)
+                print(f"Status: {status}")
+
+                # Show which axes are still initializing
+                initializing = tuple(
+                    k for k, v in status.items() if v == "initializing"
+                )
+                if initializing:
+                    print(f"  Still initializing: {initializing}")
+
+                last_register = register
 
-        time.sleep(1)
+        time.sleep(poll_delay(attempt))
+        attempt += 1
 
     return False
 
@@ -87,18 +115,24 @@ def initialize_single_axis(robot, axis, mode):
 
     robot.initialize_axis(axis, mode)
 
+    axis_key = AXIS_KEYS[axis - 1]
     start_time = time.time()
+    last_axis_status = None
+    attempt = 0
     while time.time() - start_time < 30:
         status = robot.check_initialization()
         if isinstance(status, dict):
-            axis_key = f"axis_F{axis}"
-            print(f"  Axis {axis} status: {status.get(axis_key)}")
+            axis_status = status.get(axis_key)
+            if axis_status != last_axis_status:
+                print(f"  Axis {axis} status: {axis_status}")
+                last_axis_status = axis_status
 
-            if status.get(axis_key) == "initialized":
+            if axis_status == "initialized":
                 print(f"✓ Axis {axis} initialized!")
                 return True
 
-        time.sleep(1)
+        time.sleep(poll_delay(attempt))
+        attempt += 1
 
     print(f"✗ Axis {axis} initialization timeout!")
     return False
@@ -88,14 +88,17 @@ def smooth_movement(robot, start_positions, end_positions, steps=10, delay=0.5):
     print(f"From: {start_positions}")
     print(f"To:   {end_positions}")
 
-    for step in range(steps + 1):
-        # Calculate interpolated position
-        t = step / steps
-        positions = [
-            int(start + (end - start) * t)
-            for start, end in zip(start_positions, end_positions)
+    # Precompute the whole trajectory so the loop only sends commands
+    deltas = [end - start for start, end in zip(start_positions, end_positions)]
+    trajectory = [
+        [
+            int(start + delta * step / steps)
+            for start, delta in zip(start_positions, deltas)
         ]
+        for step in range(steps + 1)
+    ]
 
+    for step, positions in enumerate(trajectory):
         print(f"Step {step}/{steps}: {positions}")
         robot.set_all_positions(positions)
         time.sleep(delay)
@@ -120,14 +123,14 @@ def speed_control_demo(robot):
     for speeds, label in speed_configs:
         print(f"\n{label} speed: {speeds}")
 
-        # Set speed
-        result = robot.set_all_speeds(speeds)
-        if result != robot.SUCCESS:
+        # Set speed and move to start position in a single burst
+        with robot.batch() as results:
+            robot.set_all_speeds(speeds)
+            robot.set_all_positions(test_positions)
+
+        if results[0] != robot.SUCCESS:
             print(f"  ✗ Failed to set speed")
             continue
-
-        # Move to start position
-        robot.set_all_positions(test_positions)
         time.sleep(2)
 
         # Measure time to move
@@ -164,18 +167,26 @@ def individual_axis_control(robot):
     """Control individual axes"""
     print("\n=== Individual Axis Control ===")
 
-    # Control each axis individually
-    for axis in range(1, 7):
-        position = 100 + (axis * 50)
-        print(f"\nSetting axis {axis} to position {position}")
+    # Give each axis its own target, but send them in a single write
+    axes = range(1, 7)
+    targets = [100 + (axis * 50) for axis in axes]
+    for axis, position in zip(axes, targets):
+        print(f"Setting axis {axis} to position {position}")
 
-        result = robot.set_axis_position(axis, position)
-        if result == robot.SUCCESS:
-            time.sleep(1)
-            current = robot.get_axis_position(axis)
-            print(f"  ✓ Axis {axis} position: {current}")
-        else:
-            print(f"  ✗ Failed")
+    result = robot.set_all_positions(targets)
+    if result != robot.SUCCESS:
+        print(f"  ✗ Failed with error code: {result}")
+        return
+
+    time.sleep(1)
+
+    # Read all positions back in a single request
+    current = robot.get_all_positions()
+    if isinstance(current, list):
+        for axis, position in zip(axes, current):
+            print(f"  ✓ Axis {axis} position: {position}")
+    else:
+        print(f"  ✗ Failed to read positions: {current}")
 
 
 def main():
@@ -2,30 +2,45 @@
 Unit tests for DH5ModbusAPI class
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from dh5_api import DH5ModbusAPI, DH5Registers, ModbusFunction
+from dh5_api.dh5_api import _build_write_registers_frame
 
 
 class TestDH5ModbusAPI:
     """Test suite for DH5ModbusAPI"""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create a mock Modbus client"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_client_class(cls):
+        """Patch ModbusSerialClient once for all tests in the class"""
         with patch("dh5_api.dh5_api.ModbusSerialClient") as mock:
-            client = MagicMock()
-            client.connect.return_value = True
-            client.connected = True
-            mock.return_value = client
-            yield client
+            yield mock
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def api(cls, mock_client_class):
+        """Create a DH5ModbusAPI instance shared by all tests in the class"""
+        return DH5ModbusAPI(port="COM6", modbus_id=1)
 
     @pytest.fixture
-    def api(self, mock_client):
-        """Create a DH5ModbusAPI instance with mocked client"""
-        api = DH5ModbusAPI(port="COM6", modbus_id=1)
+    def mock_client(self, mock_client_class):
+        """Create a fresh mock Modbus client for each test"""
+        client = MagicMock()
+        client.connect.return_value = True
+        client.connected = True
+        client.send.side_effect = len
+        mock_client_class.return_value = client
+        return client
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, mock_client, api):
+        """Reopen the shared API instance on the fresh mock client"""
+        api.max_positions = [500] * DH5Registers.AXIS_COUNT
         api.open_connection()
-        return api
 
     def test_initialization(self):
         """Test API initialization"""
@@ -62,6 +77,29 @@ class TestDH5ModbusAPI:
             result = api.open_connection()
             assert result == DH5ModbusAPI.ERROR_CONNECTION_FAILED
 
+    def test_interframe_delay(self, mock_client):
+        """Test the 3.5 character interframe delay computed from the baud rate"""
+        api = DH5ModbusAPI(port="COM6", baud_rate=115200)
+        api.open_connection()
+        assert api._t35 == pytest.approx(1.75e-3)
+
+        api = DH5ModbusAPI(port="COM6", baud_rate=9600)
+        api.open_connection()
+        assert api._t35 == pytest.approx(3.5 * 11 / 9600)
+
+    def test_interframe_gap_before_read(self, api, mock_client):
+        """Test that a read waits for the gap after a raw frame write"""
+        mock_response = Mock()
+        mock_response.registers = [100, 150, 200, 250, 300, 350]
+        mock_client.read_holding_registers.return_value = mock_response
+
+        api.set_all_positions([100, 150, 200, 250, 300, 350])
+        next_frame_time = api._next_frame_time
+        mock_client.read_holding_registers.side_effect = lambda *args, **kwargs: (
+            time.perf_counter() >= next_frame_time and mock_response
+        )
+        assert api.get_all_positions() == [100, 150, 200, 250, 300, 350]
+
     def test_close_connection(self, api):
         """Test closing connection"""
         result = api.close_connection()
@@ -86,11 +124,60 @@ class TestDH5ModbusAPI:
 
     def test_set_all_positions(self, api, mock_client):
         """Test setting all axis positions"""
-        mock_client.write_registers.return_value = Mock(function_code=0x10)
         api.max_positions = [500] * 6
         positions = [100, 150, 200, 250, 300, 350]
         result = api.set_all_positions(positions)
         assert result == DH5ModbusAPI.SUCCESS
+        mock_client.recv.assert_called_once()
+        mock_client.send.assert_called_once_with(
+            _build_write_registers_frame(
+                1, DH5Registers.AXIS_POSITION_BASE, tuple(positions)
+            )
+        )
+
+    def test_set_all_positions_clamped(self, api, mock_client):
+        """Test that positions are kept within the axis limits"""
+        api.max_positions = [500, 500, 500, 400, 15, 500]
+        result = api.set_all_positions([-5, 0, 250, 400, 300, 495])
+        assert result == DH5ModbusAPI.SUCCESS
+        mock_client.send.assert_called_once_with(
+            _build_write_registers_frame(
+                1, DH5Registers.AXIS_POSITION_BASE, (10, 10, 250, 390, 10, 490)
+            )
+        )
+
+    def test_set_all_positions_by_ratio(self, api, mock_client):
+        """Test setting all axis positions by ratio"""
+        api.max_positions = [500, 400, 300, 200, 100, 1000]
+        result = api.set_all_positions_by_ratio([0.5, 0.5, 1.0, 0.0, 0.5, 0.25])
+        assert result == DH5ModbusAPI.SUCCESS
+        mock_client.send.assert_called_once_with(
+            _build_write_registers_frame(
+                1, DH5Registers.AXIS_POSITION_BASE, (250, 200, 290, 10, 50, 250)
+            )
+        )
+
+    def test_max_positions_read_only(self, api):
+        """Test that max positions can only be changed by assignment"""
+        with pytest.raises(TypeError):
+            api.max_positions[2] = 300
+
+        api.max_positions = [500, 500, 300, 500, 500, 500]
+        assert api.max_positions == (500, 500, 300, 500, 500, 500)
+
+    def test_set_all_positions_float_values(self, api, mock_client):
+        """Test that float positions are rejected regardless of the frame cache"""
+        assert api.set_all_positions([100] * 6) == DH5ModbusAPI.SUCCESS
+        result = api.set_all_positions([100.0] * 6)
+        assert result == DH5ModbusAPI.ERROR_INVALID_RESPONSE
+        mock_client.send.assert_called_once()
+
+    def test_set_all_positions_incomplete_write(self, api, mock_client):
+        """Test setting positions when the frame is not fully written"""
+        mock_client.send.side_effect = None
+        mock_client.send.return_value = 0
+        result = api.set_all_positions([100, 150, 200, 250, 300, 350])
+        assert result == DH5ModbusAPI.ERROR_INVALID_RESPONSE
 
     def test_set_all_positions_invalid_length(self, api):
         """Test setting positions with wrong number of values"""
@@ -129,6 +216,32 @@ class TestDH5ModbusAPI:
         assert len(result) == 6
         assert all(status == "initialized" for status in result.values())
 
+    def test_check_initialization_mixed(self, api, mock_client):
+        """Test decoding a mix of initialization states"""
+        mock_response = Mock()
+        # F1 initialized, F2 initializing, F3 not initialized, F4-F6 initialized
+        mock_response.registers = [0b010101001001]
+        mock_client.read_holding_registers.return_value = mock_response
+
+        result = api.check_initialization()
+        assert result == {
+            "axis_F1": "initialized",
+            "axis_F2": "initializing",
+            "axis_F3": "not initialized",
+            "axis_F4": "initialized",
+            "axis_F5": "initialized",
+            "axis_F6": "initialized",
+        }
+
+    def test_check_initialization_mask(self, api, mock_client):
+        """Test reading the raw initialization status register"""
+        mock_response = Mock()
+        mock_response.registers = [0b010101010101]
+        mock_client.read_holding_registers.return_value = mock_response
+
+        result = api.check_initialization_mask()
+        assert result == DH5Registers.INIT_STATUS_ALL_INITIALIZED
+
     def test_reset_faults(self, api, mock_client):
         """Test resetting faults"""
         mock_client.write_register.return_value = Mock(function_code=0x06)
@@ -137,7 +250,6 @@ class TestDH5ModbusAPI:
 
     def test_set_all_speeds(self, api, mock_client):
         """Test setting all axis speeds"""
-        mock_client.write_registers.return_value = Mock(function_code=0x10)
         speeds = [0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
         result = api.set_all_speeds(speeds)
         assert result == DH5ModbusAPI.SUCCESS
@@ -149,11 +261,99 @@ class TestDH5ModbusAPI:
 
     def test_set_all_forces(self, api, mock_client):
         """Test setting all axis forces"""
-        mock_client.write_registers.return_value = Mock(function_code=0x10)
         forces = [0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
         result = api.set_all_forces(forces)
         assert result == DH5ModbusAPI.SUCCESS
 
+    def test_batch(self, api, mock_client):
+        """Test queueing write commands in a batch"""
+        with api.batch() as results:
+            assert api.set_all_speeds([0.5] * 6) == DH5ModbusAPI.SUCCESS
+            assert api.set_all_positions([100] * 6) == DH5ModbusAPI.SUCCESS
+            mock_client.send.assert_not_called()
+
+        assert results == [DH5ModbusAPI.SUCCESS, DH5ModbusAPI.SUCCESS]
+        first, second = mock_client.send.call_args_list
+        assert first.args[0] == _build_write_registers_frame(
+            1, DH5Registers.AXIS_SPEED_BASE, (50,) * 6
+        )
+        assert second.args[0] == _build_write_registers_frame(
+            1, DH5Registers.AXIS_POSITION_BASE, (100,) * 6
+        )
+
+    def test_batch_single_register(self, api, mock_client):
+        """Test that single register writes are sent as raw frames in a batch"""
+        with api.batch() as results:
+            api.reset_faults()
+
+        assert results == [DH5ModbusAPI.SUCCESS]
+        mock_client.write_register.assert_not_called()
+        mock_client.send.assert_called_once_with(bytes.fromhex("0106050100011906"))
+
+    def test_batch_copies_data(self, api, mock_client):
+        """Test that changing a queued list does not change the sent frame"""
+        positions = [100, 150, 200, 250, 300, 350]
+        with api.batch():
+            api.send_modbus_command(
+                ModbusFunction.WRITE_MULTIPLE_REGISTERS,
+                DH5Registers.AXIS_POSITION_BASE,
+                data=positions,
+            )
+            positions[0] = 999
+
+        mock_client.send.assert_called_once_with(
+            _build_write_registers_frame(
+                1, DH5Registers.AXIS_POSITION_BASE, (100, 150, 200, 250, 300, 350)
+            )
+        )
+
+    def test_batch_results(self, api, mock_client):
+        """Test that batch results report the outcome of each frame"""
+        mock_client.send.side_effect = [21, 0, 21]
+        with api.batch() as results:
+            api.set_all_speeds([0.5] * 6)
+            api.set_all_positions([100] * 6)
+            api.send_modbus_command(
+                ModbusFunction.WRITE_MULTIPLE_REGISTERS,
+                DH5Registers.AXIS_POSITION_BASE,
+                data=[100.0] * 6,
+            )
+            api.send_modbus_command(
+                ModbusFunction.WRITE_SINGLE_REGISTER,
+                DH5Registers.RESET_FAULTS,
+                data=0x10000,
+            )
+            api.set_all_forces([0.5] * 6)
+
+        assert results == [
+            DH5ModbusAPI.SUCCESS,
+            DH5ModbusAPI.ERROR_INVALID_RESPONSE,
+            DH5ModbusAPI.ERROR_INVALID_RESPONSE,
+            DH5ModbusAPI.ERROR_INVALID_RESPONSE,
+            DH5ModbusAPI.SUCCESS,
+        ]
+        assert mock_client.send.call_count == 3
+
+    def test_batch_not_connected(self, api, mock_client):
+        """Test that a batch is not sent without a connection"""
+        with api.batch() as results:
+            api.set_all_positions([100] * 6)
+            api.close_connection()
+
+        assert results == [DH5ModbusAPI.ERROR_CONNECTION_FAILED]
+        mock_client.send.assert_not_called()
+
+    def test_batch_nested(self, api, mock_client):
+        """Test that nested batches share the outermost results"""
+        with api.batch() as outer:
+            api.set_all_speeds([0.5] * 6)
+            with api.batch() as inner:
+                api.set_all_positions([100] * 6)
+            mock_client.send.assert_not_called()
+
+        assert inner is outer
+        assert outer == [DH5ModbusAPI.SUCCESS, DH5ModbusAPI.SUCCESS]
+
     def test_aging_test(self, api, mock_client):
         """Test aging test mode"""
         mock_client.write_register.return_value = Mock(function_code=0x06)
@@ -177,6 +377,21 @@ class TestDH5Registers:
         assert DH5Registers.AXIS_POSITION_BASE == 0x0101
         assert DH5Registers.AXIS_COUNT == 6
 
+    def test_init_status_values(self):
+        """Test that the all-initialized value matches the per-axis status"""
+        assert DH5Registers.INIT_STATUS_INITIALIZED == 0b01
+        assert DH5Registers.INIT_STATUS_INITIALIZING == 0b10
+        assert DH5Registers.INIT_STATUS_ALL_INITIALIZED == 0b010101010101
+
+
+class TestRTUFrame:
+    """Test suite for raw RTU frame construction"""
+
+    def test_write_registers_frame(self):
+        """Test frame layout and CRC against the Modbus specification example"""
+        frame = _build_write_registers_frame(1, 0x0001, (0x000A, 0x0102))
+        assert frame == bytes.fromhex("01100001000204000a01029230")
+
 
 class TestModbusFunction:
     """Test suite for ModbusFunction enum"""